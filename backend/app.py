@@ -1,42 +1,96 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import cv2
-import numpy as np
-import mediapipe as mp
-import joblib
+import atexit
+import importlib
 import os
-import base64
-from PIL import Image
-import io
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 app = Flask(__name__)
 CORS(app)
 
-# Initialize MediaPipe Pose
-mp_pose = mp.solutions.pose
-pose = mp_pose.Pose(
-    static_image_mode=False,
-    model_complexity=1,
-    enable_segmentation=False,
-    min_detection_confidence=0.5
-)
+# Heavy dependencies (cv2, numpy, mediapipe, joblib) and the MediaPipe graph are
+# loaded by initialize() rather than at import time, so /health answers right away.
+# It runs once per serving process: started by the first /ready probe or
+# /detect-pose call (so pre-fork servers like gunicorn --preload initialize in
+# each worker, not the master), or eagerly by `python app.py`.
+cv2 = None
+np = None
+joblib = None
+mp_pose = None
+pose = None
+
+startup_timings = {}
+startup_error = None
+_init_lock = threading.Lock()
+_ready = threading.Event()
+_init_thread = None
+_init_thread_lock = threading.Lock()
 
 # Load the trained pose classifier
-# Updated to use the new high-accuracy model
-MODEL_PATH = os.path.join(os.path.dirname(__file__), 'models', 'high_accuracy_model.pkl')
+# Prefer the versioned bundle directory (see model_bundle.py); fall back to the
+# legacy high-accuracy pickle if no bundle has been trained yet
+MODELS_DIR = os.path.join(os.path.dirname(__file__), 'models')
+MODEL_BUNDLE_PATH = os.path.join(MODELS_DIR, 'high_accuracy_model')
+MODEL_PATH = MODEL_BUNDLE_PATH if os.path.isdir(MODEL_BUNDLE_PATH) else os.path.join(MODELS_DIR, 'high_accuracy_model.pkl')
+# Feature layout produced by extract_keypoints_from_image: x, y, z, visibility for
+# each of the 33 landmarks, the same columns scripts/extract_keypoints.py writes to
+# the training CSV. Bundles must match it exactly.
+FEATURE_COLUMNS = [f'{axis}{i}' for i in range(33) for axis in 'xyzv']
+# Set POSE_VERIFY_MODEL=1 to SHA-256 every bundle artifact at load (slower startup)
+VERIFY_MODEL = os.environ.get('POSE_VERIFY_MODEL', '').lower() in ('1', 'true', 'yes')
 pose_classifier = None
+pose_scaler = None
+model_manifest = None
+model_evaluation = None
+
+# Multi-person mode: person detection + per-crop pose extraction on a worker pool
+MULTI_PERSON_WORKERS = int(os.environ.get('POSE_WORKERS', min(4, os.cpu_count() or 1)))
+MAX_PEOPLE = 6
+# Trackers are keyed by client-supplied session IDs; drop idle ones and cap the total
+TRACKER_IDLE_SECONDS = 300
+MAX_TRACKERS = 256
+_worker_state = threading.local()
+_pose_executor = None
+_executor_lock = threading.Lock()
+
+# Optional session recording for offline replay (see recording.py and
+# scripts/replay_sessions.py). Set POSE_RECORD_DIR to enable; POSE_RECORD_MODE
+# picks 'keypoints' (compact, default) or 'frames' (raw uploaded images).
+RECORD_DIR = os.environ.get('POSE_RECORD_DIR')
+RECORD_MODE = os.environ.get('POSE_RECORD_MODE', 'keypoints')
+session_recordings = None
 
 def load_classifier():
     """Load the trained pose classifier"""
-    global pose_classifier
+    global pose_classifier, pose_scaler, model_manifest, model_evaluation
     try:
-        if os.path.exists(MODEL_PATH):
+        if os.path.isdir(MODEL_PATH):
+            from model_bundle import load_bundle
+            from evaluation import load_evaluation
+            bundle = load_bundle(MODEL_PATH, expected_columns=FEATURE_COLUMNS, verify=VERIFY_MODEL)
+            pose_classifier = bundle.estimator
+            pose_scaler = bundle.scaler
+            model_manifest = bundle.manifest
+            model_evaluation = load_evaluation(MODEL_PATH, bundle.manifest)
+            accuracy = bundle.manifest['metrics'].get('accuracy', 0)
+            print(f"✅ Pose classifier bundle loaded successfully!")
+            print(f"   Created: {bundle.manifest['created_at']}")
+            print(f"   Accuracy: {accuracy:.1%}")
+            print(f"   Poses: {len(bundle.classes)}")
+            print(f"   Scaler: {'Yes' if bundle.scaler else 'No'}")
+            print(f"   Evaluation report: {'Yes' if model_evaluation else 'No'}")
+            return True
+        elif os.path.exists(MODEL_PATH):
             model_data = joblib.load(MODEL_PATH)
             
             # Check if it's the new high-accuracy model structure
             if isinstance(model_data, dict) and 'model' in model_data:
                 pose_classifier = model_data['model']
                 scaler = model_data.get('scaler')
+                pose_scaler = scaler
                 accuracy = model_data.get('accuracy', 0)
                 poses = model_data.get('poses', [])
                 print(f"✅ High-accuracy pose classifier loaded successfully!")
@@ -57,15 +111,112 @@ def load_classifier():
         print(f"❌ Error loading classifier: {e}")
         return False
 
-def extract_keypoints_from_image(image):
+def _timed(name, fn):
+    """Run fn and record its wall time (ms) under name in startup_timings"""
+    start = time.perf_counter()
+    result = fn()
+    startup_timings[name] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+def warmup_inference():
+    """Run the full pipeline once on a synthetic frame so lazy graph setup happens now"""
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    # Draw a rough stick figure so MediaPipe exercises its landmark model, not just detection
+    cv2.circle(frame, (320, 100), 30, (255, 255, 255), -1)
+    cv2.line(frame, (320, 130), (320, 300), (255, 255, 255), 12)
+    cv2.line(frame, (320, 170), (240, 250), (255, 255, 255), 10)
+    cv2.line(frame, (320, 170), (400, 250), (255, 255, 255), 10)
+    cv2.line(frame, (320, 300), (270, 440), (255, 255, 255), 10)
+    cv2.line(frame, (320, 300), (370, 440), (255, 255, 255), 10)
+    extract_keypoints_from_image(frame)
+
+    # Build every pool worker's MediaPipe graph and HOG detector now, not on the
+    # first multi-person request. The barrier holds each task until all workers
+    # have one, so no thread picks up two tasks and leaves another cold.
+    barrier = threading.Barrier(MULTI_PERSON_WORKERS, timeout=60)
+    executor = _get_pose_executor()
+    for future in [executor.submit(_warm_worker, frame, barrier) for _ in range(MULTI_PERSON_WORKERS)]:
+        future.result()
+
+    if pose_classifier is not None:
+        dummy = [0.0] * 132
+        classify_pose(dummy, [1.0] * 33)
+        classify_poses([(dummy, [1.0] * 33)])
+
+def _warm_worker(frame, barrier):
+    """Pool task: initialize this thread's pose graph and person detector"""
+    _get_worker_pose().process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    detect_people(frame)
+    barrier.wait()
+
+def initialize(warmup=True):
+    """Import heavy dependencies, build the pose graph, load the model and warm up"""
+    global cv2, np, joblib, mp_pose, pose, session_recordings, startup_error
+    with _init_lock:
+        if _ready.is_set():
+            return True
+        startup_error = None
+        startup_timings.clear()
+        try:
+            start = time.perf_counter()
+            np = _timed('import_numpy', lambda: importlib.import_module('numpy'))
+            cv2 = _timed('import_cv2', lambda: importlib.import_module('cv2'))
+            mp = _timed('import_mediapipe', lambda: importlib.import_module('mediapipe'))
+            joblib = _timed('import_joblib', lambda: importlib.import_module('joblib'))
+
+            mp_pose = mp.solutions.pose
+            pose = _timed('init_pose_graph', lambda: create_pose_graph(static_image_mode=False))
+
+            if _timed('load_classifier', load_classifier):
+                print("✅ Backend ready with pose classification!")
+            else:
+                print("⚠️  Backend running without pose classification")
+                print("   Train the model first: python train_pose_classifier.py")
+
+            if RECORD_DIR:
+                from recording import RecordingManager
+                session_recordings = RecordingManager(RECORD_DIR, RECORD_MODE)
+                atexit.register(session_recordings.close)
+                print(f"🎥 Recording sessions ({RECORD_MODE}) to {RECORD_DIR}")
+
+            if warmup:
+                _timed('warmup', warmup_inference)
+            startup_timings['total'] = round((time.perf_counter() - start) * 1000, 1)
+        except Exception as e:
+            startup_error = str(e)
+            print(f"❌ Startup failed: {e}")
+            return False
+
+        print("⏱️  Startup timings (ms):")
+        for name, elapsed in startup_timings.items():
+            print(f"   {name}: {elapsed}")
+        _ready.set()
+        return True
+
+def ensure_initialized():
+    """Block until initialize() has completed (used by inference endpoints)"""
+    return _ready.is_set() or initialize()
+
+def start_background_init():
+    """Run initialize() on a background thread once, however the app was launched"""
+    global _init_thread
+    with _init_thread_lock:
+        if _ready.is_set() or startup_error or (_init_thread is not None and _init_thread.is_alive()):
+            return
+        _init_thread = threading.Thread(target=initialize, name='startup', daemon=True)
+        _init_thread.start()
+
+def extract_keypoints_from_image(image, pose_model=None):
     """Extract MediaPipe keypoints and visibility from an image"""
+    if pose_model is None:
+        pose_model = pose
     image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    results = pose.process(image_rgb)
+    results = pose_model.process(image_rgb)
     if results.pose_landmarks:
         keypoints = []
         visibility = []
         for landmark in results.pose_landmarks.landmark:
-            keypoints.extend([landmark.x, landmark.y, landmark.z])
+            keypoints.extend([landmark.x, landmark.y, landmark.z, landmark.visibility])
             visibility.append(landmark.visibility)
         while len(keypoints) < 132:
             keypoints.append(0.0)
@@ -78,36 +229,281 @@ def extract_keypoints_from_image(image):
     else:
         return None, None, None
 
+def check_pose_visibility(visibility):
+    """Return a rejection label if too few landmarks are visible, else None"""
+    valid_keypoints = sum(1 for v in visibility if v > 0.5)
+    if valid_keypoints < 20:
+        return "Insufficient pose data"
+    # Check if key body parts are visible (nose, shoulders, hips, knees)
+    key_landmarks = [0, 11, 12, 23, 24, 25, 26]
+    visible_key_parts = sum(1 for idx in key_landmarks if idx < len(visibility) and visibility[idx] > 0.5)
+    if visible_key_parts < 4:
+        return "Body not fully visible"
+    return None
+
+def visibility_confidence(visibility):
+    """Confidence heuristic based on how many landmarks are visible"""
+    valid_keypoints = sum(1 for v in visibility if v > 0.5)
+    confidence = min(0.95, 0.6 + (valid_keypoints / 33) * 0.35)
+    if valid_keypoints < 25:
+        confidence *= 0.8
+    return confidence
+
 def classify_pose(keypoints, visibility):
     """Classify pose using the trained model and visibility info"""
     if pose_classifier is None:
         return None, 0.0
     try:
-        # Use visibility for valid keypoints
-        valid_keypoints = sum(1 for v in visibility if v > 0.5)
-        if valid_keypoints < 20:
-            return "Insufficient pose data", 0.0
-        # Check if key body parts are visible (nose, shoulders, hips, knees)
-        key_landmarks = [0, 11, 12, 23, 24, 25, 26]
-        visible_key_parts = sum(1 for idx in key_landmarks if idx < len(visibility) and visibility[idx] > 0.5)
-        if visible_key_parts < 4:
-            return "Body not fully visible", 0.0
+        rejection = check_pose_visibility(visibility)
+        if rejection is not None:
+            return rejection, 0.0
         keypoints_array = np.array(keypoints).reshape(1, -1)
-        try:
-            model_data = joblib.load(MODEL_PATH)
-            if isinstance(model_data, dict) and 'scaler' in model_data:
-                keypoints_array = model_data['scaler'].transform(keypoints_array)
-        except:
-            pass
+        if pose_scaler is not None:
+            keypoints_array = pose_scaler.transform(keypoints_array)
         prediction = pose_classifier.predict(keypoints_array)[0]
-        confidence = min(0.95, 0.6 + (valid_keypoints / 33) * 0.35)
-        if valid_keypoints < 25:
-            confidence *= 0.8
-        return prediction, confidence
+        return prediction, visibility_confidence(visibility)
     except Exception as e:
         print(f"Error in pose classification: {e}")
         return None, 0.0
 
+def classify_poses(people):
+    """Classify several (keypoints, visibility) pairs with one predict_proba call
+
+    Returns (label, confidence, probability) per person. confidence uses the same
+    visibility heuristic as classify_pose; probability is the classifier's score.
+    """
+    results = [(None, 0.0, 0.0)] * len(people)
+    if pose_classifier is None or not people:
+        return results
+    try:
+        batch_indices = []
+        for i, (keypoints, visibility) in enumerate(people):
+            rejection = check_pose_visibility(visibility)
+            if rejection is not None:
+                results[i] = (rejection, 0.0, 0.0)
+            else:
+                batch_indices.append(i)
+        if not batch_indices:
+            return results
+        keypoints_array = np.array([people[i][0] for i in batch_indices])
+        if pose_scaler is not None:
+            keypoints_array = pose_scaler.transform(keypoints_array)
+        probabilities = pose_classifier.predict_proba(keypoints_array)
+        best = probabilities.argmax(axis=1)
+        for row, i in enumerate(batch_indices):
+            label = pose_classifier.classes_[best[row]]
+            results[i] = (label, visibility_confidence(people[i][1]), float(probabilities[row, best[row]]))
+        return results
+    except Exception as e:
+        print(f"Error in batched pose classification: {e}")
+        return results
+
+def create_pose_graph(static_image_mode):
+    """Build a MediaPipe Pose graph with the server's settings"""
+    return mp_pose.Pose(
+        static_image_mode=static_image_mode,
+        model_complexity=1,
+        enable_segmentation=False,
+        min_detection_confidence=0.5
+    )
+
+def _get_worker_pose():
+    """Per-thread MediaPipe Pose instance (graphs are not thread-safe)"""
+    worker_pose = getattr(_worker_state, 'pose', None)
+    if worker_pose is None:
+        worker_pose = create_pose_graph(static_image_mode=True)
+        _worker_state.pose = worker_pose
+    return worker_pose
+
+def _get_person_detector():
+    """Per-thread OpenCV HOG person detector"""
+    hog = getattr(_worker_state, 'hog', None)
+    if hog is None:
+        hog = cv2.HOGDescriptor()
+        hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
+        _worker_state.hog = hog
+    return hog
+
+def _get_pose_executor():
+    global _pose_executor
+    with _executor_lock:
+        if _pose_executor is None:
+            _pose_executor = ThreadPoolExecutor(
+                max_workers=MULTI_PERSON_WORKERS,
+                thread_name_prefix='pose-worker'
+            )
+        return _pose_executor
+
+def detect_people(image, max_people=MAX_PEOPLE):
+    """Detect person bounding boxes (x, y, w, h) with the HOG people detector"""
+    height, width = image.shape[:2]
+    # HOG works on a fixed window size; downscale large frames for speed
+    scale = min(1.0, 640.0 / max(height, width))
+    small = cv2.resize(image, None, fx=scale, fy=scale) if scale < 1.0 else image
+    rects, weights = _get_person_detector().detectMultiScale(
+        small, winStride=(8, 8), padding=(8, 8), scale=1.05
+    )
+    if len(rects) == 0:
+        return []
+    rects = [[int(v / scale) for v in rect] for rect in rects]
+    scores = [float(w) for w in np.ravel(weights)]
+    keep = cv2.dnn.NMSBoxes(rects, scores, score_threshold=0.0, nms_threshold=0.4)
+    keep = sorted(np.ravel(keep).tolist(), key=lambda i: scores[i], reverse=True)[:max_people]
+
+    boxes = []
+    for i in keep:
+        x, y, w, h = rects[i]
+        # Pad the HOG box so extremities (raised arms, feet) stay in the crop
+        pad_x, pad_y = int(w * 0.15), int(h * 0.1)
+        x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+        x1, y1 = min(width, x + w + pad_x), min(height, y + h + pad_y)
+        boxes.append((x0, y0, x1 - x0, y1 - y0))
+    return boxes
+
+def _extract_person(image, box):
+    """Worker task: run pose extraction on a single person crop"""
+    x, y, w, h = box
+    crop = image[y:y + h, x:x + w]
+    return extract_keypoints_from_image(crop, pose_model=_get_worker_pose())
+
+def _landmarks_to_frame(landmarks, box, image_shape):
+    """Map crop-normalized landmarks back to full-frame normalized coordinates"""
+    x, y, w, h = box
+    frame_h, frame_w = image_shape[:2]
+    return [{
+        'x': (x + landmark.x * w) / frame_w,
+        'y': (y + landmark.y * h) / frame_h,
+        'z': landmark.z,
+        'visibility': landmark.visibility
+    } for landmark in landmarks.landmark]
+
+class PersonTracker:
+    """Greedy IoU tracker that keeps person IDs stable across frames"""
+
+    def __init__(self, iou_threshold=0.3, max_missed=15):
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.tracks = {}
+        self.next_id = 1
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _iou(a, b):
+        ax, ay, aw, ah = a
+        bx, by, bw, bh = b
+        ix = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+        iy = max(0, min(ay + ah, by + bh) - max(ay, by))
+        inter = ix * iy
+        union = aw * ah + bw * bh - inter
+        return inter / union if union > 0 else 0.0
+
+    def update(self, boxes):
+        """Assign a track ID to each box, returning IDs in the same order"""
+        with self.lock:
+            self.last_update = time.monotonic()
+            candidates = sorted(
+                ((self._iou(track['box'], box), track_id, i)
+                 for track_id, track in self.tracks.items()
+                 for i, box in enumerate(boxes)),
+                reverse=True
+            )
+            assigned = {}
+            used_tracks = set()
+            for iou, track_id, i in candidates:
+                if iou < self.iou_threshold:
+                    break
+                if i in assigned or track_id in used_tracks:
+                    continue
+                assigned[i] = track_id
+                used_tracks.add(track_id)
+
+            for i, box in enumerate(boxes):
+                if i not in assigned:
+                    assigned[i] = self.next_id
+                    self.next_id += 1
+                self.tracks[assigned[i]] = {'box': box, 'missed': 0}
+
+            for track_id in list(self.tracks):
+                if track_id not in used_tracks and track_id not in assigned.values():
+                    self.tracks[track_id]['missed'] += 1
+                    if self.tracks[track_id]['missed'] > self.max_missed:
+                        del self.tracks[track_id]
+
+            return [assigned[i] for i in range(len(boxes))]
+
+_trackers = OrderedDict()
+_trackers_lock = threading.Lock()
+
+def get_tracker(session_id):
+    """One tracker per client session so IDs from different cameras don't mix"""
+    with _trackers_lock:
+        now = time.monotonic()
+        for stale_id in [sid for sid, t in _trackers.items() if now - t.last_update > TRACKER_IDLE_SECONDS]:
+            del _trackers[stale_id]
+        if session_id not in _trackers:
+            # Least recently used tracker sits at the front
+            if len(_trackers) >= MAX_TRACKERS:
+                _trackers.popitem(last=False)
+            _trackers[session_id] = PersonTracker()
+        _trackers.move_to_end(session_id)
+        return _trackers[session_id]
+
+def detect_multiple_people(image, tracker=None):
+    """Detect, extract and classify every person in the frame"""
+    executor = _get_pose_executor()
+    # Detection runs on the pool too, so each worker thread keeps its own HOG detector
+    boxes = executor.submit(detect_people, image).result()
+    detected_by = 'hog'
+    if not boxes:
+        # HOG is trained on upright pedestrians and misses most lying, inverted or
+        # folded poses; fall back to the whole frame as a single person
+        height, width = image.shape[:2]
+        boxes = [(0, 0, width, height)]
+        detected_by = 'full_frame'
+    extractions = list(executor.map(lambda box: _extract_person(image, box), boxes))
+
+    people = []
+    for box, (keypoints, visibility, landmarks) in zip(boxes, extractions):
+        if keypoints is not None:
+            people.append((box, keypoints, visibility, landmarks))
+
+    track_ids = tracker.update([p[0] for p in people]) if tracker else list(range(1, len(people) + 1))
+    classifications = classify_poses([(p[1], p[2]) for p in people])
+
+    results = []
+    for track_id, (box, keypoints, visibility, landmarks), (pose_name, confidence, probability) in zip(
+            track_ids, people, classifications):
+        results.append({
+            'track_id': track_id,
+            'bbox': {'x': box[0], 'y': box[1], 'width': box[2], 'height': box[3]},
+            'keypoints': keypoints,
+            'visibility': visibility,
+            'landmarks': _landmarks_to_frame(landmarks, box, image.shape),
+            'pose_classification': pose_name,
+            'confidence': confidence,
+            'probability': probability,
+            'detected_by': detected_by
+        })
+    return results
+
+def record_session(session_id, img_bytes, people, multi_person):
+    """Append one request to the session recording, if recording is enabled"""
+    if session_recordings is None:
+        return
+    try:
+        meta = {
+            'multi_person': multi_person,
+            'results': [{'pose_classification': p['pose_classification'],
+                         'confidence': p['confidence']} for p in people]
+        }
+        session_recordings.record(
+            session_id, img_bytes,
+            [(p['keypoints'], p['visibility']) for p in people], meta
+        )
+    except Exception as e:
+        print(f"Error recording session {session_id}: {e}")
+
 @app.route('/detect-pose', methods=['POST'])
 def detect_pose():
     """Endpoint for pose detection and classification"""
@@ -120,6 +516,9 @@ def detect_pose():
         if file.filename == '':
             return jsonify({'error': 'No image file selected'}), 400
         
+        if not ensure_initialized():
+            return jsonify({'error': f'Backend failed to start: {startup_error}'}), 503
+        
         # Read image data
         img_bytes = file.read()
         if len(img_bytes) == 0:
@@ -136,10 +535,23 @@ def detect_pose():
         
         print(f"Image decoded: {image.shape}")
         
+        session_id = request.form.get('session_id', 'default')
+        if request.form.get('multi_person', '').lower() in ('1', 'true', 'yes'):
+            tracker = get_tracker(session_id)
+            people = detect_multiple_people(image, tracker)
+            print(f"Detected {len(people)} people")
+            record_session(session_id, img_bytes, people, multi_person=True)
+            return jsonify({
+                'people': people,
+                'person_count': len(people),
+                'image_shape': image.shape
+            })
+        
         # Extract keypoints
         keypoints, visibility, landmarks = extract_keypoints_from_image(image)
         
         if keypoints is None:
+            record_session(session_id, img_bytes, [], multi_person=False)
             return jsonify({
                 'error': 'No pose detected in image',
                 'keypoints': None,
@@ -154,6 +566,13 @@ def detect_pose():
         if pose_classifier is not None:
             pose_name, confidence = classify_pose(keypoints, visibility)
         
+        record_session(session_id, img_bytes, [{
+            'keypoints': keypoints,
+            'visibility': visibility,
+            'pose_classification': pose_name,
+            'confidence': confidence
+        }], multi_person=False)
+        
         # Convert landmarks to list for JSON serialization
         landmarks_list = []
         if landmarks:
@@ -186,18 +605,47 @@ def health_check():
     classifier_loaded = pose_classifier is not None
     return jsonify({
         'status': 'healthy',
+        'ready': _ready.is_set(),
         'classifier_loaded': classifier_loaded,
         'model_path': MODEL_PATH
     })
 
+@app.route('/ready', methods=['GET'])
+def readiness_check():
+    """Readiness endpoint: 200 only once dependencies are loaded and warmed up"""
+    start_background_init()
+    ready = _ready.is_set()
+    body = {
+        'ready': ready,
+        'classifier_loaded': pose_classifier is not None,
+        'startup_timings_ms': startup_timings
+    }
+    if startup_error:
+        body['error'] = startup_error
+    return jsonify(body), 200 if ready else 503
+
+@app.route('/model-info', methods=['GET'])
+def model_info():
+    """Manifest and cached evaluation report of the loaded model"""
+    if pose_classifier is None:
+        return jsonify({'error': 'No classifier loaded', 'model_path': MODEL_PATH}), 404
+    return jsonify({
+        'model_path': MODEL_PATH,
+        'format': 'bundle' if model_manifest is not None else 'legacy-pickle',
+        'manifest': model_manifest,
+        'evaluation': model_evaluation
+    })
+
 @app.route('/', methods=['GET'])
 def index():
     """Root endpoint"""
     return jsonify({
         'message': 'Yoga Pose AI Backend',
         'endpoints': {
-            'detect_pose': '/detect-pose (POST)',
-            'health': '/health (GET)'
+            'detect_pose': '/detect-pose (POST, form field multi_person=true for group mode)',
+            'health': '/health (GET)',
+            'ready': '/ready (GET)',
+            'model_info': '/model-info (GET)'
         },
         'classifier_loaded': pose_classifier is not None
     })
@@ -205,12 +653,11 @@ def index():
 if __name__ == '__main__':
     print("🚀 Starting Yoga Pose AI Backend...")
     
-    # Load the classifier
-    if load_classifier():
-        print("✅ Backend ready with pose classification!")
-    else:
-        print("⚠️  Backend running without pose classification")
-        print("   Train the model first: python train_pose_classifier.py")
+    # Warm up in the background straight away; /ready flips to 200 once done.
+    # With the debug reloader only the child process (WERKZEUG_RUN_MAIN) serves,
+    # so the watching parent skips the expensive init.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_init()
     
     print("📡 Server starting on http://localhost:5000")
     app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
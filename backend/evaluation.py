@@ -0,0 +1,124 @@
+"""Per-class evaluation report stored next to each model bundle.
+
+evaluate_model() produces a JSON-serialisable dict with per-class
+precision/recall, the confusion matrix, per-class single-sample inference
+latency and the most-confused pose pairs. Training writes it to
+``evaluation.json`` inside the bundle directory, stamped with the estimator's
+SHA-256 from the manifest; the server reads it once at load time, ignores it
+if the stamp doesn't match the loaded bundle, and serves it from /model-info.
+"""
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from model_bundle import ESTIMATOR_FILE, EVALUATION_FILE
+
+
+def _per_class_latency(estimator, X_test, y_test, classes, samples_per_class):
+    """Time single-sample predict() calls, the way the server classifies frames"""
+    latency = {}
+    for label in classes:
+        rows = X_test[y_test == label][:samples_per_class]
+        timings = []
+        for row in rows:
+            start = time.perf_counter()
+            estimator.predict(row.reshape(1, -1))
+            timings.append((time.perf_counter() - start) * 1000)
+        if timings:
+            latency[str(label)] = {
+                'mean_ms': float(np.mean(timings)),
+                'p95_ms': float(np.percentile(timings, 95)),
+                'samples': len(timings)
+            }
+    return latency
+
+
+def _most_confused_pairs(matrix, classes, top_n):
+    """Largest off-diagonal cells: (true pose, predicted pose, count, share of true pose)"""
+    support = matrix.sum(axis=1)
+    pairs = []
+    for i, j in zip(*np.nonzero(matrix)):
+        if i != j:
+            pairs.append({
+                'true': str(classes[i]),
+                'predicted': str(classes[j]),
+                'count': int(matrix[i, j]),
+                'rate': float(matrix[i, j] / support[i]) if support[i] else 0.0
+            })
+    pairs.sort(key=lambda p: (p['count'], p['rate']), reverse=True)
+    return pairs[:top_n]
+
+
+def evaluate_model(estimator, X_test, y_test, top_confused=10, latency_samples=20):
+    """Build the evaluation report for a fitted estimator on held-out data"""
+    # Imported here so the server can read reports without pulling in sklearn.metrics
+    from sklearn.metrics import accuracy_score, confusion_matrix, precision_recall_fscore_support
+
+    X_test = np.asarray(X_test)
+    y_test = np.asarray(y_test)
+    classes = list(estimator.classes_)
+    y_pred = estimator.predict(X_test)
+
+    precision, recall, f1, support = precision_recall_fscore_support(
+        y_test, y_pred, labels=classes, zero_division=0
+    )
+    matrix = confusion_matrix(y_test, y_pred, labels=classes)
+
+    report = {
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'accuracy': float(accuracy_score(y_test, y_pred)),
+        'test_samples': int(len(y_test)),
+        'per_class': {
+            str(label): {
+                'precision': float(precision[i]),
+                'recall': float(recall[i]),
+                'f1': float(f1[i]),
+                'support': int(support[i])
+            } for i, label in enumerate(classes)
+        },
+        'confusion_matrix': {
+            'labels': [str(label) for label in classes],
+            'matrix': matrix.tolist()
+        },
+        'latency': _per_class_latency(estimator, X_test, y_test, classes, latency_samples),
+        'most_confused': _most_confused_pairs(matrix, classes, top_confused)
+    }
+
+    importances = getattr(estimator, 'feature_importances_', None)
+    if importances is not None:
+        top = np.argsort(importances)[::-1][:10]
+        report['top_features'] = [{'index': int(i), 'importance': float(importances[i])} for i in top]
+
+    return report
+
+
+def _bundle_stamp(manifest):
+    """Identifies the estimator a report was computed for"""
+    return {
+        'created_at': manifest['created_at'],
+        'estimator_sha256': manifest['artifacts'][ESTIMATOR_FILE]['sha256']
+    }
+
+
+def save_evaluation(directory, report, manifest):
+    """Write evaluation.json into a model bundle directory, tied to the bundle's estimator"""
+    report = dict(report, bundle=_bundle_stamp(manifest))
+    path = os.path.join(directory, EVALUATION_FILE)
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_evaluation(directory, manifest):
+    """Read evaluation.json, or None if missing or computed for a different estimator"""
+    path = os.path.join(directory, EVALUATION_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        report = json.load(f)
+    if report.get('bundle') != _bundle_stamp(manifest):
+        return None
+    return report
@@ -0,0 +1,193 @@
+"""Versioned model bundle format for the pose classifier.
+
+A bundle is a directory:
+
+    manifest.json       format version, feature schema (column layout), class list,
+                        training metrics, dataset hash, creation time and the size
+                        and SHA-256 of every artifact
+    estimator.joblib    the fitted estimator, dumped uncompressed so loading skips
+                        decompression
+    scaler_mean.npy     StandardScaler parameters as raw arrays (optional)
+    scaler_scale.npy
+
+Loading never unpickles a scaler, and the manifest (feature layout, artifact
+sizes) is checked before the much larger estimator is touched. Full SHA-256
+verification is opt-in because it reads every byte of the estimator.
+
+The estimator is not memory-mapped: tree ensembles (the RandomForest the training
+scripts produce) copy their node arrays into private buffers when unpickled, so
+mapping the file would not share those arrays between workers.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+import joblib
+import numpy as np
+
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+ESTIMATOR_FILE = 'estimator.joblib'
+SCALER_MEAN_FILE = 'scaler_mean.npy'
+SCALER_SCALE_FILE = 'scaler_scale.npy'
+# Written by evaluation.save_evaluation; removed whenever the bundle is rebuilt
+EVALUATION_FILE = 'evaluation.json'
+
+
+class BundleError(Exception):
+    """Raised when a bundle is missing, corrupt or incompatible"""
+
+
+class ArrayScaler:
+    """Minimal StandardScaler replacement built from the bundle's raw arrays"""
+
+    def __init__(self, mean, scale):
+        self.mean_ = mean
+        self.scale_ = scale
+
+    def transform(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.mean_) / self.scale_
+
+
+class ModelBundle:
+    """A loaded bundle: manifest, estimator and (optional) scaler"""
+
+    def __init__(self, path, manifest, estimator, scaler):
+        self.path = path
+        self.manifest = manifest
+        self.estimator = estimator
+        self.scaler = scaler
+
+    @property
+    def classes(self):
+        return self.manifest['classes']
+
+    @property
+    def n_features(self):
+        return self.manifest['feature_schema']['n_features']
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _to_builtin(value):
+    """Make numpy scalars/arrays JSON serialisable"""
+    if isinstance(value, dict):
+        return {str(k): _to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return _to_builtin(value.tolist())
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def save_bundle(directory, estimator, feature_columns, scaler=None, metrics=None, dataset_path=None):
+    """Write a model bundle directory and return its manifest"""
+    os.makedirs(directory, exist_ok=True)
+    # A report left over from a previous build describes a different estimator
+    stale_evaluation = os.path.join(directory, EVALUATION_FILE)
+    if os.path.exists(stale_evaluation):
+        os.remove(stale_evaluation)
+
+    artifacts = [ESTIMATOR_FILE]
+    joblib.dump(estimator, os.path.join(directory, ESTIMATOR_FILE), compress=0)
+
+    if scaler is not None:
+        n_features = len(feature_columns)
+        mean = getattr(scaler, 'mean_', None)
+        scale = getattr(scaler, 'scale_', None)
+        np.save(os.path.join(directory, SCALER_MEAN_FILE),
+                np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64))
+        np.save(os.path.join(directory, SCALER_SCALE_FILE),
+                np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64))
+        artifacts += [SCALER_MEAN_FILE, SCALER_SCALE_FILE]
+
+    manifest = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'estimator_type': type(estimator).__name__,
+        'feature_schema': {
+            'n_features': len(feature_columns),
+            'columns': list(feature_columns)
+        },
+        'classes': _to_builtin(list(estimator.classes_)),
+        'metrics': _to_builtin(metrics or {}),
+        'dataset_sha256': file_sha256(dataset_path) if dataset_path else None,
+        'artifacts': {
+            name: {
+                'sha256': file_sha256(os.path.join(directory, name)),
+                'size': os.path.getsize(os.path.join(directory, name))
+            } for name in artifacts
+        }
+    }
+    with open(os.path.join(directory, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_manifest(directory):
+    """Read and validate a bundle manifest without loading any arrays"""
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise BundleError(f"No {MANIFEST_FILE} in {directory}")
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    version = manifest.get('format_version')
+    if version != BUNDLE_FORMAT_VERSION:
+        raise BundleError(f"Unsupported bundle format version {version} (expected {BUNDLE_FORMAT_VERSION})")
+    return manifest
+
+
+def _first_column_mismatch(expected, actual):
+    for i, (e, a) in enumerate(zip(expected, actual)):
+        if e != a:
+            return f"column {i} is {a!r}, expected {e!r}"
+    return f"{len(actual)} columns, expected {len(expected)}"
+
+
+def load_bundle(directory, expected_columns=None, verify=False):
+    """Load a bundle, rejecting it if its feature layout or artifacts don't match
+
+    expected_columns is the caller's feature layout; the bundle is rejected unless
+    its manifest lists exactly the same columns in the same order. Artifact sizes
+    are always checked; verify=True also checks every SHA-256.
+    """
+    manifest = read_manifest(directory)
+
+    columns = manifest['feature_schema']['columns']
+    if expected_columns is not None and list(columns) != list(expected_columns):
+        raise BundleError(
+            "Bundle feature layout does not match the server's: "
+            + _first_column_mismatch(list(expected_columns), list(columns))
+        )
+
+    for name, artifact in manifest['artifacts'].items():
+        path = os.path.join(directory, name)
+        if not os.path.exists(path):
+            raise BundleError(f"Missing bundle artifact: {name}")
+        if os.path.getsize(path) != artifact['size']:
+            raise BundleError(f"Size mismatch for bundle artifact: {name}")
+        if verify and file_sha256(path) != artifact['sha256']:
+            raise BundleError(f"Checksum mismatch for bundle artifact: {name}")
+
+    estimator = joblib.load(os.path.join(directory, ESTIMATOR_FILE))
+    if [str(c) for c in estimator.classes_] != [str(c) for c in manifest['classes']]:
+        raise BundleError("Estimator classes do not match the manifest class list")
+
+    scaler = None
+    if SCALER_MEAN_FILE in manifest['artifacts']:
+        scaler = ArrayScaler(
+            np.load(os.path.join(directory, SCALER_MEAN_FILE)),
+            np.load(os.path.join(directory, SCALER_SCALE_FILE))
+        )
+
+    return ModelBundle(directory, manifest, estimator, scaler)
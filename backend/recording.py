@@ -0,0 +1,166 @@
+"""Session recording for offline replay and load testing.
+
+A recording is a ``.posrec`` file per client session (a session that goes idle
+and later resumes continues in a new file):
+
+    header:  magic b'PREC' | version (u8) | mode (u8) | session start, unix time (f64)
+    records: offset seconds since start (f64) | payload length (u32) | meta length (u32)
+             | payload bytes | meta bytes (UTF-8 JSON)
+
+In ``frames`` mode the payload is the encoded image exactly as uploaded. In
+``keypoints`` mode it is a float32 array of shape (people, 165): 132 keypoint
+values followed by 33 visibilities per person. The meta JSON holds the server's
+results for that frame so a replay can check parity.
+"""
+import json
+import os
+import re
+import struct
+import threading
+import time
+import uuid
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+MAGIC = b'PREC'
+FORMAT_VERSION = 1
+MODES = ('frames', 'keypoints')
+KEYPOINT_VALUES = 132
+VISIBILITY_VALUES = 33
+
+_HEADER = struct.Struct('<4sBBd')
+_RECORD = struct.Struct('<dII')
+
+Record = namedtuple('Record', ['timestamp', 'payload', 'meta'])
+
+
+def encode_keypoints(people):
+    """Pack [(keypoints, visibility), ...] into a compact float32 payload"""
+    rows = [list(keypoints) + list(visibility) for keypoints, visibility in people]
+    return np.asarray(rows, dtype=np.float32).reshape(-1, KEYPOINT_VALUES + VISIBILITY_VALUES).tobytes()
+
+
+def decode_keypoints(payload):
+    """Inverse of encode_keypoints: returns [(keypoints, visibility), ...]"""
+    rows = np.frombuffer(payload, dtype=np.float32).reshape(-1, KEYPOINT_VALUES + VISIBILITY_VALUES)
+    return [(row[:KEYPOINT_VALUES].tolist(), row[KEYPOINT_VALUES:].tolist()) for row in rows]
+
+
+class SessionRecorder:
+    """Append-only writer for one session's recording file"""
+
+    def __init__(self, path, mode):
+        if mode not in MODES:
+            raise ValueError(f"Unknown recording mode: {mode!r} (expected one of {MODES})")
+        self.path = path
+        self.mode = mode
+        self.started = time.monotonic()
+        self.last_write = self.started
+        self.lock = threading.Lock()
+        # 'xb' never truncates an existing recording
+        self.file = open(path, 'xb')
+        self.file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, MODES.index(mode), time.time()))
+
+    def write(self, payload, meta):
+        """Append one record; returns False if the recorder was already closed"""
+        meta_bytes = json.dumps(meta, default=str).encode('utf-8')
+        with self.lock:
+            if self.file.closed:
+                return False
+            self.last_write = time.monotonic()
+            offset = self.last_write - self.started
+            self.file.write(_RECORD.pack(offset, len(payload), len(meta_bytes)))
+            self.file.write(payload)
+            self.file.write(meta_bytes)
+            self.file.flush()
+            return True
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+class RecordingManager:
+    """Hands out one SessionRecorder per session ID under a recording directory
+
+    Recorders idle for more than idle_seconds are closed, and at most max_open
+    files are kept open (least recently written closed first). A session that
+    comes back after being closed continues in a new file.
+    """
+
+    def __init__(self, directory, mode='keypoints', idle_seconds=120, max_open=64):
+        if mode not in MODES:
+            raise ValueError(f"Unknown recording mode: {mode!r} (expected one of {MODES})")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.mode = mode
+        self.idle_seconds = idle_seconds
+        self.max_open = max_open
+        self.recorders = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _close_idle(self):
+        """Close recorders that haven't been written to recently (caller holds self.lock)"""
+        now = time.monotonic()
+        for session_id in [sid for sid, r in self.recorders.items() if now - r.last_write > self.idle_seconds]:
+            self.recorders.pop(session_id).close()
+
+    def recorder(self, session_id):
+        with self.lock:
+            self._close_idle()
+            if session_id not in self.recorders:
+                while len(self.recorders) >= self.max_open:
+                    _, recorder = self.recorders.popitem(last=False)
+                    recorder.close()
+                safe_id = re.sub(r'[^A-Za-z0-9_.-]', '_', session_id)[:64] or 'default'
+                # The uuid suffix keeps IDs that sanitize to the same prefix from colliding
+                filename = f"{safe_id}-{int(time.time())}-{uuid.uuid4().hex[:8]}.posrec"
+                self.recorders[session_id] = SessionRecorder(
+                    os.path.join(self.directory, filename), self.mode
+                )
+            self.recorders.move_to_end(session_id)
+            return self.recorders[session_id]
+
+    def record(self, session_id, image_bytes, people, meta):
+        """Record one request: the raw frame or the per-person keypoints, plus results"""
+        if self.mode == 'frames':
+            payload = image_bytes
+        else:
+            payload = encode_keypoints(people)
+        # Another thread may close this recorder between lookup and write; retry once
+        # so the frame lands in the session's next file
+        if not self.recorder(session_id).write(payload, meta):
+            self.recorder(session_id).write(payload, meta)
+
+    def close(self):
+        with self.lock:
+            for recorder in self.recorders.values():
+                recorder.close()
+            self.recorders.clear()
+
+
+def read_recording(path):
+    """Load a recording file; returns (header dict, list of Record)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, mode_index, started_at = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a session recording")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path} has unsupported recording version {version}")
+    header = {'version': version, 'mode': MODES[mode_index], 'started_at': started_at}
+
+    records = []
+    offset = _HEADER.size
+    while offset + _RECORD.size <= len(data):
+        timestamp, payload_len, meta_len = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if offset + payload_len + meta_len > len(data):
+            break  # truncated final record (server stopped mid-write)
+        payload = data[offset:offset + payload_len]
+        offset += payload_len
+        meta = json.loads(data[offset:offset + meta_len].decode('utf-8'))
+        offset += meta_len
+        records.append(Record(timestamp, payload, meta))
+    return header, records
@@ -0,0 +1,77 @@
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import app  # noqa: E402
+
+
+def build_frame(person_image, people):
+    """Tile a single-person image side by side to simulate a group class"""
+    height = person_image.shape[0]
+    tiles = [person_image] * people
+    frame = np.hstack(tiles)
+    # Keep the aspect ratio camera-like by padding the frame vertically
+    target_height = max(height, int(frame.shape[1] * 9 / 16))
+    if target_height > height:
+        pad = target_height - height
+        frame = cv2.copyMakeBorder(frame, pad // 2, pad - pad // 2, 0, 0, cv2.BORDER_CONSTANT)
+    return frame
+
+
+def benchmark_multi_person(image_path, max_people=6, iterations=20, warmup=3):
+    """Measure multi-person throughput for 1..max_people people per frame"""
+    person_image = cv2.imread(image_path)
+    if person_image is None:
+        print(f"Could not read image: {image_path}")
+        return None
+
+    if not app.initialize():
+        return None
+
+    print(f"=== Multi-Person Benchmark ({app.MULTI_PERSON_WORKERS} workers) ===")
+    print("Note: the HOG person detector only finds upright people; frames where it finds")
+    print("nobody fall back to one full-frame person (shown in the 'fallback' column).")
+    print(f"{'people':>6} {'detected':>8} {'fallback':>8} {'mean ms':>9} {'p95 ms':>8} {'fps':>6}")
+
+    results = {}
+    for people in range(1, max_people + 1):
+        frame = build_frame(person_image, people)
+        tracker = app.PersonTracker()
+
+        for _ in range(warmup):
+            app.detect_multiple_people(frame, tracker)
+
+        latencies = []
+        detected = 0
+        fallback = False
+        for _ in range(iterations):
+            start = time.perf_counter()
+            found = app.detect_multiple_people(frame, tracker)
+            latencies.append((time.perf_counter() - start) * 1000)
+            detected = len(found)
+            fallback = any(p['detected_by'] == 'full_frame' for p in found)
+
+        mean_ms = float(np.mean(latencies))
+        p95_ms = float(np.percentile(latencies, 95))
+        fps = 1000.0 / mean_ms if mean_ms > 0 else 0.0
+        results[people] = {'detected': detected, 'fallback': fallback,
+                           'mean_ms': mean_ms, 'p95_ms': p95_ms, 'fps': fps}
+        print(f"{people:>6} {detected:>8} {'yes' if fallback else 'no':>8} "
+              f"{mean_ms:>9.1f} {p95_ms:>8.1f} {fps:>6.1f}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark multi-person pose detection throughput")
+    parser.add_argument('image', help="Image containing a single person (tiled to build group frames)")
+    parser.add_argument('--max-people', type=int, default=6)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    benchmark_multi_person(args.image, args.max_people, args.iterations)
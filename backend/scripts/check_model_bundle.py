@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import app  # noqa: E402
+from model_bundle import load_bundle, save_bundle  # noqa: E402
+
+
+def training_csv_header():
+    """The header extract_keypoints.py writes, minus the leading label column"""
+    header = []
+    for i in range(33):
+        header += [f'x{i}', f'y{i}', f'z{i}', f'v{i}']
+    return header
+
+
+def check_model_bundle():
+    """Save a bundle the way the training scripts do and load it the way the server does"""
+    print("=== Model Bundle Round-Trip Check ===")
+    columns = training_csv_header()
+
+    rng = np.random.default_rng(42)
+    X = rng.random((60, len(columns)))
+    y = np.array(['tree', 'warrior', 'downdog'] * 20)
+    scaler = StandardScaler().fit(X)
+    model = RandomForestClassifier(n_estimators=5, random_state=42).fit(scaler.transform(X), y)
+
+    with tempfile.TemporaryDirectory() as bundle_dir:
+        save_bundle(bundle_dir, model, feature_columns=columns, scaler=scaler, metrics={'accuracy': 1.0})
+        bundle = load_bundle(bundle_dir, expected_columns=app.FEATURE_COLUMNS, verify=True)
+
+        expected = model.predict(scaler.transform(X))
+        actual = bundle.estimator.predict(bundle.scaler.transform(X))
+        if not np.array_equal(expected, actual):
+            print("❌ Predictions changed after the round trip")
+            return False
+
+    print("✅ Training CSV layout matches the server's FEATURE_COLUMNS")
+    print("✅ Bundle round trip preserves predictions")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check_model_bundle() else 1)
@@ -0,0 +1,50 @@
+import argparse
+import os
+import sys
+
+import joblib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from model_bundle import save_bundle  # noqa: E402
+
+
+def convert_model_to_bundle(model_file, bundle_dir, csv_file=None):
+    """Convert a legacy joblib pickle (bare classifier or model/scaler dict) into a bundle"""
+    model_data = joblib.load(model_file)
+
+    if isinstance(model_data, dict) and 'model' in model_data:
+        estimator = model_data['model']
+        scaler = model_data.get('scaler')
+        metrics = {'accuracy': model_data['accuracy']} if 'accuracy' in model_data else {}
+    else:
+        estimator = model_data
+        scaler = None
+        metrics = {}
+
+    # Legacy pickles don't record column names. Use the CSV header when available,
+    # otherwise the layout extract_keypoints.py writes (x, y, z, v per landmark),
+    # which is what every legacy model in this repo was trained on
+    if csv_file:
+        with open(csv_file) as f:
+            feature_columns = f.readline().strip().split(',')[1:]
+    else:
+        feature_columns = []
+        for i in range(33):
+            feature_columns += [f'x{i}', f'y{i}', f'z{i}', f'v{i}']
+
+    manifest = save_bundle(bundle_dir, estimator, feature_columns, scaler=scaler,
+                           metrics=metrics, dataset_path=csv_file)
+    print(f"✅ Converted {model_file} -> {bundle_dir}")
+    print(f"   Features: {manifest['feature_schema']['n_features']}")
+    print(f"   Poses: {len(manifest['classes'])}")
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a legacy .pkl pose model into a model bundle")
+    parser.add_argument('model_file', nargs='?', default='../models/high_accuracy_model.pkl')
+    parser.add_argument('bundle_dir', nargs='?', default='../models/high_accuracy_model')
+    parser.add_argument('--csv', help="Training CSV, used for feature names and the dataset hash")
+    args = parser.parse_args()
+
+    convert_model_to_bundle(args.model_file, args.bundle_dir, args.csv)
@@ -3,11 +3,8 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.svm import SVC
-from sklearn.metrics import classification_report, accuracy_score, confusion_matrix
-import joblib
+from sklearn.metrics import classification_report, accuracy_score
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 def analyze_dataset(csv_file='../../data/processed/yoga_keypoints.csv'):
     """Analyze the current dataset and provide improvement recommendations"""
@@ -129,10 +126,14 @@ from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.svm import SVC
 from sklearn.metrics import classification_report, accuracy_score
 from sklearn.preprocessing import StandardScaler
-import joblib
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from evaluation import evaluate_model, save_evaluation  # noqa: E402
+from model_bundle import save_bundle  # noqa: E402
 
-def train_high_accuracy_model(csv_file='yoga_keypoints.csv', model_file='high_accuracy_pose_classifier.pkl'):
+def train_high_accuracy_model(csv_file='yoga_keypoints.csv', model_dir='../models/high_accuracy_model'):
     """
     Train a high-accuracy pose classifier with improved preprocessing
     """
@@ -182,6 +183,7 @@ def train_high_accuracy_model(csv_file='yoga_keypoints.csv', model_file='high_ac
     
     best_model = None
     best_accuracy = 0
+    best_cv_scores = None
     
     for name, model in models.items():
         print(f"\\nTraining {name}...")
@@ -200,18 +202,38 @@ def train_high_accuracy_model(csv_file='yoga_keypoints.csv', model_file='high_ac
         if accuracy > best_accuracy:
             best_accuracy = accuracy
             best_model = model
+            best_cv_scores = cv_scores
+    
+    # Save the best model and scaler as a versioned bundle
+    manifest = save_bundle(
+        model_dir,
+        best_model,
+        feature_columns=list(df.columns[1:]),
+        scaler=scaler,
+        metrics={
+            'accuracy': best_accuracy,
+            'cv_accuracy_mean': best_cv_scores.mean(),
+            'cv_accuracy_std': best_cv_scores.std(),
+            'train_samples': len(X_train),
+            'test_samples': len(X_test)
+        },
+        dataset_path=csv_file
+    )
+    print(f"\\n✅ Best model saved to {model_dir} with {best_accuracy:.3f} accuracy")
+    
+    # Persist per-class metrics, confusion matrix and latency next to the model
+    evaluation = evaluate_model(best_model, X_test, y_test)
+    save_evaluation(model_dir, evaluation, manifest)
+    print(f"📋 Evaluation report saved to {model_dir}/evaluation.json")
     
-    # Save the best model and scaler
     model_data = {
         'model': best_model,
         'scaler': scaler,
         'accuracy': best_accuracy,
-        'poses': list(valid_poses)
+        'poses': list(valid_poses),
+        'manifest': manifest
     }
     
-    joblib.dump(model_data, model_file)
-    print(f"\\n✅ Best model saved with {best_accuracy:.3f} accuracy")
-    
     return model_data
 
 if __name__ == "__main__":
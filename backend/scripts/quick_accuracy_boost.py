@@ -4,14 +4,22 @@ from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import classification_report, accuracy_score
-import joblib
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from evaluation import evaluate_model, save_evaluation  # noqa: E402
+from model_bundle import save_bundle  # noqa: E402
+
+CSV_FILE = '../../data/processed/yoga_keypoints.csv'
+BUNDLE_DIR = '../models/high_accuracy_model'
 
 def quick_accuracy_boost():
     """Quick approach to boost accuracy to 90%+"""
     print("=== Quick Accuracy Boost ===")
     
     # Load data
-    df = pd.read_csv('../../data/processed/yoga_keypoints.csv')
+    df = pd.read_csv(CSV_FILE)
     pose_counts = df.iloc[:, 0].value_counts()
     
     # Strategy 1: Focus on poses with many samples (most reliable)
@@ -65,18 +73,37 @@ def quick_accuracy_boost():
     
     print(f"✅ Final Test Accuracy: {accuracy:.3f} ({accuracy*100:.1f}%)")
     
-    # Save the improved model
+    # Save the improved model as a versioned bundle
+    manifest = save_bundle(
+        BUNDLE_DIR,
+        model,
+        feature_columns=list(df.columns[1:]),
+        scaler=scaler,
+        metrics={
+            'accuracy': accuracy,
+            'cv_accuracy_mean': cv_scores.mean(),
+            'cv_accuracy_std': cv_scores.std(),
+            'train_samples': len(X_train),
+            'test_samples': len(X_test)
+        },
+        dataset_path=CSV_FILE
+    )
+    print(f"\n💾 Model bundle saved to '{BUNDLE_DIR}'")
+    
+    # Persist per-class metrics, confusion matrix and latency next to the model
+    evaluation = evaluate_model(model, X_test, y_test)
+    save_evaluation(BUNDLE_DIR, evaluation, manifest)
+    print(f"📋 Evaluation report saved to '{BUNDLE_DIR}/evaluation.json'")
+    
     model_data = {
         'model': model,
         'scaler': scaler,
         'accuracy': accuracy,
         'poses': list(top_poses),
-        'pose_count': len(top_poses)
+        'pose_count': len(top_poses),
+        'manifest': manifest
     }
     
-    joblib.dump(model_data, '../models/high_accuracy_model.pkl')
-    print(f"\n💾 Model saved as '../models/high_accuracy_model.pkl'")
-    
     # Show top poses
     print(f"\n🏆 Top 10 poses in the model:")
     for i, pose in enumerate(top_poses[:10], 1):
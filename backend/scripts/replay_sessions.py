@@ -0,0 +1,182 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from recording import decode_keypoints, read_recording  # noqa: E402
+
+
+def post_frame(target, image_bytes, session_id, multi_person):
+    """POST one frame to /detect-pose as multipart/form-data"""
+    boundary = uuid.uuid4().hex
+    fields = {'session_id': session_id}
+    if multi_person:
+        fields['multi_person'] = 'true'
+
+    body = b''
+    for name, value in fields.items():
+        body += (f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+                 f'{value}\r\n').encode('utf-8')
+    body += (f'--{boundary}\r\nContent-Disposition: form-data; name="image"; filename="frame.jpg"\r\n'
+             f'Content-Type: image/jpeg\r\n\r\n').encode('utf-8')
+    body += image_bytes + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
+    req = urllib.request.Request(
+        f'{target.rstrip("/")}/detect-pose', data=body, method='POST',
+        headers={'Content-Type': f'multipart/form-data; boundary={boundary}'}
+    )
+    with urllib.request.urlopen(req) as resp:
+        response = json.loads(resp.read().decode('utf-8'))
+
+    if 'people' in response:
+        return [p['pose_classification'] for p in response['people']]
+    if response.get('keypoints') is None:
+        return []
+    return [response.get('pose_classification')]
+
+
+def classify_locally(app, record, header, tracking_pose):
+    """Run the record through the in-process pipeline (classifier only for keypoint recordings)"""
+    if header['mode'] == 'keypoints':
+        people = decode_keypoints(record.payload)
+        if record.meta.get('multi_person'):
+            return [label for label, _, _ in app.classify_poses(people)]
+        return [app.classify_pose(keypoints, visibility)[0] for keypoints, visibility in people]
+
+    image = app.cv2.imdecode(np.frombuffer(record.payload, np.uint8), app.cv2.IMREAD_COLOR)
+    if record.meta.get('multi_person'):
+        return [p['pose_classification'] for p in app.detect_multiple_people(image)]
+    # Same tracking-mode graph type the server used, but one per simulated user
+    keypoints, visibility, _ = app.extract_keypoints_from_image(image, pose_model=tracking_pose)
+    if keypoints is None:
+        return []
+    return [app.classify_pose(keypoints, visibility)[0]]
+
+
+def replay_user(user_id, header, records, run_request, speed, stats):
+    """Replay one recorded session, honouring the original timing unless speed is 0"""
+    start = time.monotonic()
+    for record in records:
+        if speed > 0:
+            delay = start + record.timestamp / speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        request_start = time.perf_counter()
+        try:
+            labels = run_request(user_id, record, header)
+        except Exception as e:
+            with stats['lock']:
+                stats['errors'] += 1
+            print(f"User {user_id}: request failed: {e}")
+            continue
+        latency_ms = (time.perf_counter() - request_start) * 1000
+
+        expected = [r['pose_classification'] for r in record.meta.get('results', [])]
+        with stats['lock']:
+            stats['latencies'].append(latency_ms)
+            stats['compared'] += 1
+            if [str(label) for label in labels] == [str(label) for label in expected]:
+                stats['matched'] += 1
+
+
+def replay_sessions(paths, target=None, users=1, speed=1.0):
+    """Drive the backend (or the in-process pipeline) with recorded sessions"""
+    sessions = [read_recording(path) for path in paths]
+    sessions = [(header, records) for header, records in sessions if records]
+    if not sessions:
+        print("No recorded frames found.")
+        return None
+
+    if target:
+        if any(header['mode'] != 'frames' for header, _ in sessions):
+            print("Replaying against a server requires recordings made with POSE_RECORD_MODE=frames")
+            return None
+
+        def run_request(user_id, record, header):
+            return post_frame(target, record.payload, f'replay-{user_id}', record.meta.get('multi_person'))
+    else:
+        import app
+        if not app.initialize():
+            return None
+
+        # Each user's session runs on a single thread, so its graph is never shared
+        user_graphs = {}
+        graphs_lock = threading.Lock()
+
+        def run_request(user_id, record, header):
+            with graphs_lock:
+                if header['mode'] == 'frames' and user_id not in user_graphs:
+                    user_graphs[user_id] = app.create_pose_graph(static_image_mode=False)
+            return classify_locally(app, record, header, user_graphs.get(user_id))
+
+    stats = {'latencies': [], 'compared': 0, 'matched': 0, 'errors': 0, 'lock': threading.Lock()}
+    mode = 'as fast as possible' if speed <= 0 else f'{speed:g}x speed'
+    print(f"=== Replaying {len(sessions)} session(s) with {users} user(s), {mode} ===")
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as executor:
+        futures = [
+            executor.submit(replay_user, user_id, *sessions[user_id % len(sessions)], run_request, speed, stats)
+            for user_id in range(users)
+        ]
+        for future in futures:
+            future.result()
+    wall_time = time.perf_counter() - wall_start
+
+    latencies = np.array(stats['latencies'])
+    if len(latencies) == 0:
+        print("All requests failed.")
+        return None
+
+    report = {
+        'requests': int(len(latencies)),
+        'errors': stats['errors'],
+        'throughput_rps': len(latencies) / wall_time,
+        'latency_ms': {
+            'mean': float(latencies.mean()),
+            'p50': float(np.percentile(latencies, 50)),
+            'p90': float(np.percentile(latencies, 90)),
+            'p99': float(np.percentile(latencies, 99)),
+            'max': float(latencies.max())
+        },
+        'parity': stats['matched'] / stats['compared'] if stats['compared'] else 0.0
+    }
+
+    print(f"Requests: {report['requests']} ({report['errors']} errors) in {wall_time:.1f}s "
+          f"-> {report['throughput_rps']:.1f} req/s")
+    print("Latency (ms): " + ", ".join(f"{k} {v:.1f}" for k, v in report['latency_ms'].items()))
+    print(f"Result parity with recording: {report['parity']:.1%}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded pose sessions for load and regression testing")
+    parser.add_argument('recordings', nargs='+', help=".posrec files or directories containing them")
+    parser.add_argument('--target', help="Backend URL (e.g. http://127.0.0.1:5000); omit to run in-process")
+    parser.add_argument('--users', type=int, default=1, help="Number of simulated concurrent users")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Playback speed relative to the recording; 0 replays as fast as possible")
+    parser.add_argument('--json', help="Write the report to this JSON file")
+    args = parser.parse_args()
+
+    paths = []
+    for path in args.recordings:
+        if os.path.isdir(path):
+            paths.extend(sorted(glob.glob(os.path.join(path, '*.posrec'))))
+        else:
+            paths.append(path)
+
+    report = replay_sessions(paths, args.target, args.users, args.speed)
+    if report and args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
@@ -3,10 +3,14 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report, accuracy_score
-import joblib
 import os
+import sys
 
-def train_pose_classifier(csv_file='../../data/processed/yoga_keypoints.csv', model_file='../models/pose_classifier.pkl'):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from evaluation import evaluate_model, save_evaluation  # noqa: E402
+from model_bundle import load_bundle, save_bundle  # noqa: E402
+
+def train_pose_classifier(csv_file='../../data/processed/yoga_keypoints.csv', model_dir='../models/pose_classifier'):
     """
     Train a pose classifier using extracted keypoints data
     """
@@ -71,25 +75,42 @@ def train_pose_classifier(csv_file='../../data/processed/yoga_keypoints.csv', mo
     for i, feature_idx in enumerate(reversed(top_features)):
         print(f"  {i+1}. Keypoint {feature_idx}: {feature_importance[feature_idx]:.4f}")
     
-    # Save the trained model
-    print(f"\nSaving model to {model_file}...")
-    joblib.dump(classifier, model_file)
+    # Save the trained model as a versioned bundle
+    print(f"\nSaving model bundle to {model_dir}...")
+    manifest = save_bundle(
+        model_dir,
+        classifier,
+        feature_columns=list(df.columns[1:]),
+        metrics={
+            'accuracy': accuracy,
+            'train_samples': len(X_train),
+            'test_samples': len(X_test)
+        },
+        dataset_path=csv_file
+    )
     print("Model saved successfully!")
     
+    # Persist per-class metrics, confusion matrix and latency next to the model
+    evaluation = evaluate_model(classifier, X_test, y_test)
+    save_evaluation(model_dir, evaluation, manifest)
+    print(f"Evaluation report saved to {model_dir}/evaluation.json")
+    for pair in evaluation['most_confused'][:5]:
+        print(f"  Confused: {pair['true']} -> {pair['predicted']} ({pair['count']}x, {pair['rate']:.0%})")
+    
     return classifier
 
-def test_model_on_sample(model_file='../models/pose_classifier.pkl', csv_file='../../data/processed/yoga_keypoints.csv'):
+def test_model_on_sample(model_dir='../models/pose_classifier', csv_file='../../data/processed/yoga_keypoints.csv'):
     """
     Test the trained model on a few samples
     """
-    if not os.path.exists(model_file):
-        print(f"Model file {model_file} not found!")
+    if not os.path.isdir(model_dir):
+        print(f"Model bundle {model_dir} not found!")
         return
     
     print("\nTesting model on sample data...")
     
     # Load the model
-    classifier = joblib.load(model_file)
+    classifier = load_bundle(model_dir).estimator
     
     # Load some test data
     df = pd.read_csv(csv_file)
@@ -116,7 +137,7 @@ if __name__ == "__main__":
         
         print("\n=== Training Complete! ===")
         print("Next steps:")
-        print("1. The model is saved as 'pose_classifier.pkl'")
+        print("1. The model is saved as the 'pose_classifier' bundle directory")
         print("2. You can now integrate this model into your Flask backend")
         print("3. The model will classify poses based on MediaPipe keypoints")
     else: